@@ -72,6 +72,7 @@ setup(
     package_dir={"": "src"},
     packages=find_packages(where="src"),
     install_requires=install_requires,
+    extras_require={"jit": ["numba"]},
     classifiers=[
         # License
         "License :: OSI Approved :: GNU Affero General Public License v3",
@@ -29,7 +29,6 @@ from abc import ABC
 from typing import Union
 
 import numpy as np
-from scipy.linalg import circulant
 from scipy.sparse import csr_matrix
 
 from qudiet.circuit_library.standard_gates.quantum_gate import QuantumGate
@@ -76,7 +75,7 @@ class ArbitaryGate(QuantumGate, ABC):
             raise Exception(f"The defined gate is not \"unitary\". Please use a unitary matrix / tensor to define the gate.")
 
         # Dimension Check
-        if type(self.dims) == int:
+        if isinstance(self.dims, (int, np.integer)):
             assert self._unitary.shape == (self.dims, self.dims)
         elif type(self.dims) == list:
             if len(self.dims) == 1:
@@ -23,7 +23,6 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from abc import ABC
 from typing import Tuple, Union
 
 import numpy as np
@@ -36,7 +35,7 @@ from qudiet.utils.linalg import ttg
 from qudiet.utils.numpy import get_index
 
 
-class CXGate(QuantumGate, ABC):
+class CXGate(QuantumGate):
     def __init__(
         self,
         qreg: "tuple[int, int]",
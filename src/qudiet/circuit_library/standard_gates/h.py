@@ -24,18 +24,36 @@
 #
 
 import math
-from abc import ABC
 from typing import Union
 
 import numpy as np
-from scipy.linalg import circulant
-from scipy.sparse import csr_matrix
 
 from qudiet.circuit_library.standard_gates.quantum_gate import QuantumGate
 from qudiet.core.backend.core import Backend
+from qudiet.utils.linalg import read_only_cache
 
 
-class HGate(QuantumGate, ABC):
+@read_only_cache
+def _hadamard_unitary(dims: int, backend: Backend) -> np.ndarray:
+    """
+    Builds the Hadamard unitary for a given dimension. The result only depends on the dimension and the backend, so
+    it is computed once and shared by every HGate of that kind.
+    :param dims: Integer representing the dimension of the gate
+    :param backend: The backend in which the matrix is stored
+    :return: The gate unitary
+    """
+    # U[j, k] = omega^(j * k) / sqrt(dims), with omega the principal dims-th root of unity
+    _k = np.arange(dims)
+    _unitary = np.exp((2j * np.pi / dims) * np.multiply.outer(_k, _k))
+    _unitary *= 1 / math.sqrt(dims)
+
+    # Every entry of the Hadamard is non-zero, so it is kept as a dense array even on sparse backends
+    return backend.array(_unitary)
+
+
+class HGate(QuantumGate):
+    __slots__ = ("qreg", "dims", "backend", "_unitary")
+
     def __init__(self, qreg: int, dims: int, backend: Backend):
         """
         This generates the Hadamard Gate object for a given set of dimensions and a qreg number
@@ -45,6 +63,7 @@ class HGate(QuantumGate, ABC):
         self.qreg = qreg
         self.dims = dims
         self.backend = backend
+        self._unitary = None
 
     @property
     def is_controlled(self) -> bool:
@@ -64,24 +83,15 @@ class HGate(QuantumGate, ABC):
         return True
 
     @property
-    def unitary(self) -> csr_matrix:
+    def unitary(self) -> np.ndarray:
         """
         This is the gate unitary which shall be used to do any calculation
         :return: The gate unitary
         """
-        _roots_of_unity_build_list = np.zeros(self.dims + 1)
-        _roots_of_unity_build_list[0] = 1
-        _roots_of_unity_build_list[self.dims] = -1
-        _roots_of_unity = np.roots(_roots_of_unity_build_list)
-        _usable_roots_of_unity = np.delete(_roots_of_unity, len(_roots_of_unity) - 1)
-        _unitary_builder = circulant(_usable_roots_of_unity)
-        _unitary_builder_first_row = np.ones(len(_usable_roots_of_unity))
-        _unitary_first = np.vstack([_unitary_builder_first_row, _unitary_builder])
-        _unitary_first_column = np.ones(len(_usable_roots_of_unity) + 1)
-        _unitary_unnormalized = np.c_[_unitary_first_column, _unitary_first]
-        _unitary = 1 / (math.sqrt(self.dims)) * _unitary_unnormalized
+        if self._unitary is None:
+            self._unitary = _hadamard_unitary(self.dims, self.backend)
 
-        return self.backend.matrix(_unitary)
+        return self._unitary
 
     @property
     def acting_on(self) -> Union[int, list]:
@@ -23,16 +23,29 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from abc import ABC
 from typing import Union
 
 from scipy import sparse
 
 from qudiet.circuit_library.standard_gates.quantum_gate import QuantumGate
 from qudiet.core.backend.core import Backend
+from qudiet.utils.linalg import read_only_cache
 
 
-class IGate(QuantumGate, ABC):
+@read_only_cache
+def _identity_unitary(dims: int, backend: Backend) -> sparse:
+    """
+    Builds the identity unitary for a given dimension once per backend.
+    :param dims: Integer representing the dimension of the gate
+    :param backend: The backend in which the matrix is stored
+    :return: The gate unitary
+    """
+    return backend.eye(n=dims, m=dims)
+
+
+class IGate(QuantumGate):
+    __slots__ = ("qreg", "dims", "backend", "_unitary")
+
     def __init__(self, qreg: int, dims: int, backend: Backend):
         """
         This generates the Identity Gate object for a given set of dimensions and a qreg number
@@ -42,6 +55,7 @@ class IGate(QuantumGate, ABC):
         self.qreg = qreg
         self.dims = dims
         self.backend = backend
+        self._unitary = None
 
     @property
     def is_controlled(self) -> bool:
@@ -59,13 +73,24 @@ class IGate(QuantumGate, ABC):
         """
         return True
 
+    @property
+    def is_identity(self) -> bool:
+        """
+        Check if the gate is an identity placeholder, which lets a Moment skip it during execution
+        :return: True or False, depending on the scenario
+        """
+        return True
+
     @property
     def unitary(self) -> sparse:
         """
         This is the gate unitary which shall be used to do any calculation
         :return: The gate unitary
         """
-        return self.backend.eye(n=self.dims, m=self.dims)
+        if self._unitary is None:
+            self._unitary = _identity_unitary(self.dims, self.backend)
+
+        return self._unitary
 
     @property
     def acting_on(self) -> int:
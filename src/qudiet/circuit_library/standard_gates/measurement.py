@@ -23,13 +23,12 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from abc import ABC
 from typing import Union
 
 from qudiet.circuit_library.standard_gates.quantum_gate import QuantumGate
 
 
-class Measurement(QuantumGate, ABC):
+class Measurement(QuantumGate):
     def __init__(self, qreg: int):
         self._qreg = qreg
 
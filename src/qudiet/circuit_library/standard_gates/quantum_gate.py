@@ -34,6 +34,8 @@ class QuantumGate(ABC):
     The QuantumGate abstract class presents a template of all quantum gates to be constructed.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def is_controlled(self) -> bool:
@@ -52,6 +54,14 @@ class QuantumGate(ABC):
         """
         pass
 
+    @property
+    def is_identity(self) -> bool:
+        """
+        Check if the gate is an identity placeholder, which lets a Moment skip it during execution
+        :return: True or False, depending on the scenario
+        """
+        return False
+
     @property
     @abstractmethod
     def unitary(self) -> sparse:
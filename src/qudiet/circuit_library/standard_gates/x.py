@@ -23,18 +23,30 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from abc import ABC
 from typing import Union
 
-import numpy as np
-from scipy.linalg import circulant
 from scipy.sparse import csr_matrix
 
 from qudiet.circuit_library.standard_gates.quantum_gate import QuantumGate
 from qudiet.core.backend.core import Backend
+from qudiet.utils.linalg import read_only_cache, shift_csr
 
 
-class XGate(QuantumGate, ABC):
+@read_only_cache
+def _shift_unitary(dims: int, plus: int, backend: Backend) -> csr_matrix:
+    """
+    Builds the shift-by-plus unitary for a given dimension once per backend.
+    :param dims: Integer representing the dimension of the gate
+    :param plus: The value by which the gate increments the register
+    :param backend: The backend in which the matrix is stored
+    :return: The gate unitary
+    """
+    return backend.matrix(shift_csr(dims, plus))
+
+
+class XGate(QuantumGate):
+    __slots__ = ("qreg", "dims", "backend", "plus", "_unitary")
+
     def __init__(self, qreg: int, dims: int, plus: int, backend: Backend):
         """
         This generates the Pauli-X Gate object for a given set of dimensions and a qreg number
@@ -45,6 +57,7 @@ class XGate(QuantumGate, ABC):
         self.dims = dims
         self.backend = backend
         self.plus = plus
+        self._unitary = None
 
     @property
     def is_controlled(self) -> bool:
@@ -68,11 +81,10 @@ class XGate(QuantumGate, ABC):
         This is the gate unitary which shall be used to do any calculation
         :return: The gate unitary
         """
-        _unitary_builder = np.zeros(shape=(self.dims, 1))
-        _unitary_builder[self.plus] = 1
-        _unitary = self.backend.matrix(circulant(_unitary_builder))
+        if self._unitary is None:
+            self._unitary = _shift_unitary(self.dims, self.plus, self.backend)
 
-        return _unitary
+        return self._unitary
 
     @property
     def acting_on(self) -> Union[int, list]:
@@ -23,17 +23,34 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from abc import ABC
 from typing import Union
 
 import numpy as np
-from scipy.sparse import csr_matrix
+from scipy.sparse import csr_matrix, diags
 
 from qudiet.circuit_library.standard_gates.quantum_gate import QuantumGate
 from qudiet.core.backend.core import Backend
+from qudiet.utils.linalg import read_only_cache
 
 
-class ZGate(QuantumGate, ABC):
+@read_only_cache
+def _clock_unitary(dims: int, backend: Backend) -> csr_matrix:
+    """
+    Builds the Z unitary for a given dimension once per backend.
+    :param dims: Integer representing the dimension of the gate
+    :param backend: The backend in which the matrix is stored
+    :return: The gate unitary
+    """
+    # Z is diagonal with omega^k on the k-th entry, so only its d non-zeros are ever stored
+    _roots_of_unity = np.exp(2j * np.pi * np.arange(dims) / dims)
+    _unitary = diags(_roots_of_unity, format="csr")
+
+    return backend.matrix(_unitary)
+
+
+class ZGate(QuantumGate):
+    __slots__ = ("qreg", "dims", "backend", "_unitary")
+
     def __init__(self, qreg: int, dims: int, backend: Backend):
         """
         This generates the Z-Pauli Gate object for a given set of dimensions and a qreg number
@@ -43,6 +60,7 @@ class ZGate(QuantumGate, ABC):
         self.qreg = qreg
         self.dims = dims
         self.backend = backend
+        self._unitary = None
 
     @property
     def is_controlled(self) -> bool:
@@ -67,14 +85,10 @@ class ZGate(QuantumGate, ABC):
         This is the gate unitary which shall be used to do any calculation
         :return: The gate unitary
         """
-        _roots_of_unity_build_list = np.zeros(self.dims + 1)
-        _roots_of_unity_build_list[0] = 1
-        _roots_of_unity_build_list[self.dims] = -1
-        _roots_of_unity = np.roots(_roots_of_unity_build_list)
-        _roots_of_unity = np.flipud(_roots_of_unity)
-        _unitary = np.diag(np.flipud(_roots_of_unity))
+        if self._unitary is None:
+            self._unitary = _clock_unitary(self.dims, self.backend)
 
-        return self.backend.matrix(_unitary)
+        return self._unitary
 
     @property
     def acting_on(self) -> Union[int, list]:
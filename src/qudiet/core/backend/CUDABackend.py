@@ -35,6 +35,7 @@ else:
 import os
 
 import numpy as np
+import scipy.sparse
 
 
 class CUDABackend(Backend):
@@ -57,6 +58,8 @@ class CUDABackend(Backend):
 
     @staticmethod
     def matrix(a):
+        if scipy.sparse.issparse(a):
+            a = a.toarray()
         if isinstance(a, np.ndarray):
             a = cp.array(a)
         s = a.shape
@@ -64,6 +67,10 @@ class CUDABackend(Backend):
             a = a.reshape((*s, 1))
         return a
 
+    @staticmethod
+    def array(a):
+        return CUDABackend.matrix(a)
+
     @staticmethod
     def nonzero(a):
         return a.nonzero()
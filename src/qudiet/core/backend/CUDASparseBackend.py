@@ -61,6 +61,11 @@ class CUDASparseBackend(Backend):
             a = cp.array(a)
         return sparse.csr_matrix(a)
 
+    @staticmethod
+    def array(a):
+        # cupyx.scipy.sparse.kron does not accept dense operands, so everything stays in CSR here
+        return CUDASparseBackend.matrix(a)
+
     @staticmethod
     def nonzero(a):
         return a.nonzero()
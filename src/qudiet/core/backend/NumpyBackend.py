@@ -24,6 +24,7 @@
 #
 
 import numpy as np
+from scipy import sparse
 
 from qudiet.core.backend.core import Backend
 
@@ -43,12 +44,18 @@ class NumpyBackend(Backend):
 
     @staticmethod
     def matrix(a):
+        if sparse.issparse(a):
+            a = a.toarray()
         a = np.array(a)
         s = a.shape
         if len(s) == 1:
             a = a.reshape((*s, 1))
         return a
 
+    @staticmethod
+    def array(a):
+        return NumpyBackend.matrix(a)
+
     @staticmethod
     def nonzero(a):
         return a.nonzero()
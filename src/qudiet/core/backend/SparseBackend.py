@@ -45,6 +45,11 @@ class SparseBackend(Backend):
     def matrix(a):
         return sparse.csr_matrix(a)
 
+    @staticmethod
+    def array(a):
+        # Fully dense operators gain nothing from CSR, scipy.sparse.kron and dot accept ndarray operands as they are
+        return np.asarray(a)
+
     @staticmethod
     def nonzero(a):
         return a.nonzero()
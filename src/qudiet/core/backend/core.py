@@ -47,6 +47,10 @@ class Backend:
     def matrix(self, a):
         raise NotImplemented()
 
+    @staticmethod
+    def array(self, a):
+        raise NotImplementedError
+
     @staticmethod
     def nonzero(self, a):
         raise NotImplemented()
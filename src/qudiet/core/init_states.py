@@ -28,6 +28,18 @@ from scipy import sparse
 from scipy.sparse import csr_matrix, dok_matrix
 
 from qudiet.core.backend.core import Backend
+from qudiet.utils.linalg import read_only_cache
+
+
+@read_only_cache
+def _basis_state(dim: int, state: int, backend: Backend):
+    """
+    Column vector of the computational basis state |state> of a dim level qudit, converted by the backend. Every
+    InitState of the same dim, state and backend reads the same cached vector.
+    """
+    _state = np.zeros((dim, 1))
+    _state[state] = 1
+    return backend.matrix(_state)
 
 
 class InitState:
@@ -47,11 +59,8 @@ class InitState:
             self.state = state
             self.qreg = qreg
             # self.init_state = dok_matrix(np.zeros((dim, 1)))
-            self.init_state = np.zeros((dim, 1))
-            self.init_state[state] = 1
             self.backend = backend
-
-            self.init_state = self.backend.matrix(self.init_state)
+            self.init_state = _basis_state(int(dim), int(state), self.backend)
 
         # print("------------------------------------------------")
         # print(f"State {self.state} initialized \n")
@@ -25,15 +25,99 @@
 
 from typing import Union
 
+import numpy as np
 from scipy import sparse
 
 from qudiet.circuit_library.standard_gates.cx import CXGate
-from qudiet.circuit_library.standard_gates.h import HGate
+from qudiet.circuit_library.standard_gates.h import HGate, _hadamard_unitary
 from qudiet.circuit_library.standard_gates.i import IGate
+from qudiet.circuit_library.standard_gates.measurement import Measurement
 from qudiet.circuit_library.standard_gates.quantum_gate import QuantumGate
-from qudiet.circuit_library.standard_gates.x import XGate
-from qudiet.circuit_library.standard_gates.z import ZGate
+from qudiet.circuit_library.standard_gates.x import XGate, _shift_unitary
+from qudiet.circuit_library.standard_gates.z import ZGate, _clock_unitary
 from qudiet.core.init_states import InitState
+from qudiet.utils.linalg import isiterable
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional, install it with the "jit" extra. Without it the kernels below simply run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _fill_moment_soa(tags, dims, factor_regs, factor_dims):
+    """
+    Plans the kronecker product of a MomentSoA. Every acting register becomes a factor of its own and every run of
+    idle registers is folded into a single identity factor.
+
+    :param tags: Integer array of gate tags, one per register, 0 being the identity
+    :param dims: Integer array of register dimensions
+    :param factor_regs: Output array, the register of each factor or -1 for an identity factor
+    :param factor_dims: Output array, the dimension of each identity factor
+    :return: The number of factors written
+    """
+    _n_factors = 0
+    _identity_dims = 1
+    for _reg in range(tags.shape[0]):
+        if tags[_reg] == 0:
+            _identity_dims *= dims[_reg]
+            continue
+        if _identity_dims > 1:
+            factor_regs[_n_factors] = -1
+            factor_dims[_n_factors] = _identity_dims
+            _n_factors += 1
+            _identity_dims = 1
+        factor_regs[_n_factors] = _reg
+        factor_dims[_n_factors] = dims[_reg]
+        _n_factors += 1
+    if _identity_dims > 1:
+        factor_regs[_n_factors] = -1
+        factor_dims[_n_factors] = _identity_dims
+        _n_factors += 1
+    return _n_factors
+
+
+def _kron_factors(backend, factors):
+    """
+    Kronecker product of a sequence of factors, where an integer factor stands for the identity of that dimension.
+    Consecutive identities are never expanded one register at a time, since I_a (x) I_b = I_ab. Their dimensions are
+    accumulated and a single identity is produced when the run ends.
+
+    :param backend: The backend used for the products
+    :param factors: Iterable of gate unitaries or integer identity dimensions, in register order
+    :return: Returns the resultant layer state
+    """
+    _kron_product = None
+    _identity_dims = 1
+
+    for _factor in factors:
+        if isinstance(_factor, (int, np.integer)):
+            _identity_dims *= int(_factor)
+            continue
+
+        _unitary = _factor
+        if _identity_dims > 1:
+            _identity = backend.eye(n=_identity_dims, m=_identity_dims)
+            _unitary = backend.kron(_identity, _unitary)
+            _identity_dims = 1
+
+        if _kron_product is None:
+            _kron_product = _unitary
+        else:
+            _kron_product = backend.kron(_kron_product, _unitary)
+
+    if _identity_dims > 1:
+        _identity = backend.eye(n=_identity_dims, m=_identity_dims)
+        if _kron_product is None:
+            _kron_product = _identity
+        else:
+            _kron_product = backend.kron(_kron_product, _identity)
+
+    return _kron_product
 
 
 class Moment:
@@ -60,9 +144,15 @@ class Moment:
         self._moment_list = []
 
         self._result = self.__populate_list()
+        # Structure-of-arrays form, recorded as the gates are placed and kept in sync by replace_igate
+        self._soa = MomentSoA.from_moment(self)
 
         # TODO: Run unit tests
 
+    @property
+    def soa(self) -> "Union[MomentSoA, None]":
+        return self._soa
+
     @property
     def prev_pointer(self):
         return self._prev_pointer
@@ -144,10 +234,63 @@ class Moment:
         gate, index = self.get_qreg_moment(_qreg, True)
         if isinstance(gate, IGate):
             self._moment_list[index] = gate_obj
+            if self._soa is not None and not self._soa.place(index, gate_obj):
+                self._soa = None
             return True
         else:
             return False
 
+    @property
+    def acting_mask(self) -> np.ndarray:
+        """
+        Marks which entries of the Moment list actually act on the state, i.e. are not identity placeholders
+        :return: Boolean array aligned with the Moment list
+        """
+        return np.array(
+            [
+                not (isinstance(_operation, QuantumGate) and _operation.is_identity)
+                for _operation in self._moment_list
+            ],
+            dtype=bool,
+        )
+
+    @property
+    def fingerprint(self) -> tuple:
+        """
+        Structural fingerprint of the Moment, made of the class, the acting registers and the dimension of every entry
+        of the Moment list. Two Moments with the same fingerprint hold the same kinds of gates in the same places.
+        :return: Hashable tuple describing the Moment
+        """
+        _fingerprint = []
+        for _operation in self._moment_list:
+            if isinstance(_operation, InitState):
+                _fingerprint.append(
+                    (InitState, _operation.qreg, _operation.dim, _operation.state)
+                )
+                continue
+            _acting_on = _operation.acting_on
+            _dims = getattr(_operation, "dims", None)
+            _fingerprint.append(
+                (
+                    type(_operation),
+                    tuple(_acting_on) if isiterable(_acting_on) else _acting_on,
+                    tuple(_dims) if isiterable(_dims) else _dims,
+                )
+            )
+        return tuple(_fingerprint)
+
+    @property
+    def is_idempotent(self) -> bool:
+        """
+        Checks if applying the Moment twice in a row is the same as applying it once, i.e. it only holds identities
+        and measurements
+        :return: True or False, depending on the scenario
+        """
+        return all(
+            isinstance(_operation, (IGate, Measurement))
+            for _operation in self._moment_list
+        )
+
     def peek_list(self) -> list:
         """
         Function used to peek the list
@@ -202,18 +345,124 @@ class Moment:
 
         :return: Returns the resultant layer state
         """
-        _kron_product = self._moment_list[0].unitary
-
-        for i, gate in enumerate(self._moment_list[1:]):
-            # TODO : What is this ? Why this if statement ?
-
-            # gate is self._moment_list[i+1], i denotes the index of the previous gate...
-            # Thus, self._moment_list[i] is the previous gate
-            _kron_product = backend.kron(_kron_product, gate.unitary)
-        return _kron_product
+        return _kron_factors(
+            backend,
+            (
+                gate.unitary if acting else int(gate.dims)
+                for gate, acting in zip(self._moment_list, self.acting_mask)
+            ),
+        )
 
     def preprocess(self, ):
         pass
 
     def postprocess(self, ):
-        pass
\ No newline at end of file
+        pass
+
+
+class MomentSoA:
+    # Gate type tags of the per-register tag array
+    I, H, X, Z = range(4)
+
+    __slots__ = ("tags", "dims", "params")
+
+    def __init__(self, tags: np.ndarray, dims: np.ndarray, params: np.ndarray):
+        """
+        This is the structure-of-arrays form of a Moment made of single qudit gates. Instead of one gate object per
+        register it holds one entry per register in each of a few flat arrays:
+
+        tags:   the gate type acting on the register (MomentSoA.I, MomentSoA.H, ...)
+        dims:   the dimension of the register
+        params: the gate parameter, i.e. plus for X and 0 otherwise
+
+        Gates are dispatched on their tag at execution time, so identical (tag, dims, params) entries share one
+        unitary and idle registers are never touched.
+
+        :param tags: Integer array of gate tags, one per register
+        :param dims: Integer array of register dimensions
+        :param params: Integer array of gate parameters
+        """
+        self.tags = tags
+        self.dims = dims
+        self.params = params
+
+    @classmethod
+    def from_moment(cls, moment: Moment) -> "Union[MomentSoA, None]":
+        """
+        Builds the structure-of-arrays form of a Moment.
+
+        :param moment: The Moment to be converted
+        :return: The MomentSoA, or None if the Moment holds anything other than IGate, HGate, XGate or ZGate, in
+                 which case the Moment has to be executed as it is
+        """
+        _moment_list = moment.peek_list()
+        _reg_length = len(_moment_list)
+        _moment_soa = cls(
+            np.zeros(_reg_length, dtype=np.int8),
+            np.zeros(_reg_length, dtype=np.int32),
+            np.zeros(_reg_length, dtype=np.int32),
+        )
+
+        for _index, _gate in enumerate(_moment_list):
+            if not _moment_soa.place(_index, _gate):
+                return None
+
+        return _moment_soa
+
+    def place(self, index: int, gate_obj: QuantumGate) -> bool:
+        """
+        Records a gate at the given register
+
+        :param index: The register the gate acts on
+        :param gate_obj: Gate object of either IGate, HGate, XGate or ZGate
+        :return: True if the gate was recorded, else False
+        """
+        _tag = _SOA_TAGS.get(type(gate_obj))
+        if _tag is None or gate_obj.acting_on != index:
+            return False
+        self.tags[index] = _tag
+        self.dims[index] = gate_obj.dims
+        self.params[index] = gate_obj.plus if _tag == MomentSoA.X else 0
+        return True
+
+    def exec(self, backend):
+        """
+        Executes the gates (kronecker product) and returns the result
+
+        :return: Returns the resultant layer state
+        """
+        _reg_length = len(self.tags)
+        factor_regs = np.empty(_reg_length, dtype=np.int64)
+        factor_dims = np.empty(_reg_length, dtype=np.int64)
+        _n_factors = _fill_moment_soa(self.tags, self.dims, factor_regs, factor_dims)
+
+        _unitaries = {}
+        _factors = []
+        for _reg, _dims in zip(factor_regs[:_n_factors], factor_dims[:_n_factors]):
+            if _reg < 0:
+                _factors.append(int(_dims))
+                continue
+            _tag, _dims, _plus = (
+                int(self.tags[_reg]),
+                int(self.dims[_reg]),
+                int(self.params[_reg]),
+            )
+            _key = (_tag, _dims, _plus)
+            if _key not in _unitaries:
+                if _tag == MomentSoA.H:
+                    _unitaries[_key] = _hadamard_unitary(_dims, backend)
+                elif _tag == MomentSoA.X:
+                    _unitaries[_key] = _shift_unitary(_dims, _plus, backend)
+                else:
+                    _unitaries[_key] = _clock_unitary(_dims, backend)
+            _factors.append(_unitaries[_key])
+
+        return _kron_factors(backend, _factors)
+
+
+_SOA_TAGS = {
+    IGate: MomentSoA.I,
+    HGate: MomentSoA.H,
+    XGate: MomentSoA.X,
+    ZGate: MomentSoA.Z,
+}
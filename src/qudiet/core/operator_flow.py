@@ -58,6 +58,10 @@ class OperatorFlow:
 
         self.debug_backend = DefaultBackend
 
+        # Executes Moments made only of single qudit gates through their structure-of-arrays form when set to True.
+        # The planning kernel is compiled when numba is installed and runs as plain Python otherwise.
+        self.use_soa = False
+
     def peek(self) -> list:
         """
         Responsible for peeking the list of Moments
@@ -161,6 +165,13 @@ class OperatorFlow:
                 if all(self._measurement_count):
                     return False
 
+                # An idempotent Moment that repeats the last one exactly adds nothing to the circuit, so it is
+                # dropped instead of appended
+                if _curr_moment.is_idempotent and (
+                    _curr_moment.fingerprint == self._opflow_list[-1].fingerprint
+                ):
+                    continue
+
                 # if self.debug:
                 #     self.debugger += [(_curr_moment, _curr_moment.exec(self.debug_backend))]
 
@@ -177,6 +188,13 @@ class OperatorFlow:
                 except StopIteration:
                     _qreg = None
 
+                # Only a Moment holding a single gate can be folded into an earlier Moment. Full layers, such as
+                # the ones built by QuantumCircuit.h_all, are kept whole.
+                if _qreg is not None and (
+                    sum(not isinstance(_gate, IGate) for _gate in _curr_moment_list) > 1
+                ):
+                    _qreg = None
+
                 # Loops through the OperatorFlow list, checks if any of the earlier Moment(s) have an IGate.
                 # If yes, replaces it with HGate, XGate or ZGate of the current
                 # Moment.
@@ -267,7 +285,11 @@ class OperatorFlow:
         for _moment in reversed(_all_moments):
             _moment.preprocess()
             # Executable moments
-            _kron_product = _moment.exec(backend)
+            _moment_soa = _moment.soa if self.use_soa else None
+            if _moment_soa is not None:
+                _kron_product = _moment_soa.exec(backend)
+            else:
+                _kron_product = _moment.exec(backend)
 
             # If _dot_product does not have a value, assigns the value of _kron_product to _dot_product
             # else, calculates the dot product of _dot_product and _kron_product and assigns it to _dot_product.
@@ -35,6 +35,8 @@ from typing import Optional, Union
 from collections import Counter
 import warnings
 
+import numpy as np
+
 from qudiet.circuit_library.standard_gates.cx import CXGate
 from qudiet.circuit_library.standard_gates.h import HGate
 from qudiet.circuit_library.standard_gates.i import IGate
@@ -54,6 +56,21 @@ from qudiet.utils.linalg import isiterable
 
 
 class QuantumCircuit:
+    __slots__ = (
+        "backend",
+        "debug_backend",
+        "output_processor",
+        "qregs",
+        "cregs",
+        "name",
+        "init_states",
+        "op_flow",
+        "_reg_length",
+        "_reg_dims",
+        "_identity_gates",
+        "_gate_cache",
+    )
+
     def __init__(
         self,
         qregs: "Union[tuple[int, int], list[int]]",
@@ -94,27 +111,35 @@ class QuantumCircuit:
                 "The registers must be defined as a tuple of two integers or a list of integers"
             )
         self.qregs = qregs
-        self.cregs = cregs or 0
-        self.name = name or ""
-        self.init_states = init_states or []
+        self.cregs = cregs if cregs is not None else 0
+        self.name = name if name is not None else ""
 
         self.op_flow = OperatorFlow()
         self.op_flow.debug_backend = self.debug_backend
         self.op_flow.debug = debug
 
-        self._is_qregs_tuple = type(self.qregs) == tuple
-        self._is_qregs_list = type(self.qregs) == list
-
-        if self._is_qregs_tuple:
-            self._reg_length = self.qregs[0]
-            self._reg_dims = self._reg_length * [self.qregs[1]]
+        if isinstance(self.qregs, tuple):
+            self._reg_dims = np.full(self.qregs[0], self.qregs[1], dtype=np.int32)
+        else:
+            self._reg_dims = np.asarray(self.qregs, dtype=np.int32)
+        self._reg_length = len(self._reg_dims)
+
+        # IGate only depends on the register it pads and its dimension, so one instance per register is shared by
+        # every Moment of the circuit
+        self._identity_gates = [
+            IGate(qreg=_reg, dims=self._reg_dims[_reg], backend=self.backend)
+            for _reg in range(self._reg_length)
+        ]
 
-        elif self._is_qregs_list:
-            self._reg_length = len(self.qregs)
-            self._reg_dims = self.qregs
+        # HGate, XGate and ZGate objects never change after construction, so they are reused per
+        # (gate class, qreg, dims, plus)
+        self._gate_cache = {}
 
-        if self._reg_length > len(self.init_states):
-            self.init_states.extend((self._reg_length - len(self.init_states)) * [0])
+        # A fresh list is always allocated so that the caller's init_states list is never aliased or mutated.
+        # Registers without an explicit initial state default to |0>.
+        self.init_states = self._reg_length * [0]
+        if init_states is not None:
+            self.init_states[: len(init_states)] = init_states
 
         self.__initialize_states()
 
@@ -144,16 +169,35 @@ class QuantumCircuit:
         :param qreg: The quantum register number for putting the gate
         :param dims: The dimension of the gate
         """
-        if type(qreg) is list:
-            return [self.__validate_gate_inputs(qreg_i, dims) for qreg_i in qreg]
+        # Lists of registers are checked in one go against the register dimension array
+        _qregs = np.asarray(qreg)
 
-        if qreg > self._reg_length - 1:
+        if np.any((_qregs < 0) | (_qregs >= self._reg_length)):
             raise ValueError(
                 "Illegal placement of gate. Register specified is out of circuit bounds."
             )
-        if dims and dims > self._reg_dims[qreg]:
+        if dims and np.any(dims > self._reg_dims[_qregs]):
             raise ValueError("Input dimension is greater than the register dimension.")
 
+    def __get_gate(
+        self, gate_cls: type, qreg: int, dims: int, **kwargs
+    ) -> Union[HGate, XGate, ZGate]:
+        """
+        Returns the cached gate object for the given gate class, register and dimension, creating it on first use
+
+        :param gate_cls: One of the single qudit gate classes, e.g. HGate, XGate, etc.
+        :param qreg: The quantum register number for putting the gate
+        :param dims: The dimension of the gate
+        :param kwargs: Any further gate parameters, e.g. plus for XGate
+        :return: The gate object
+        """
+        _key = (gate_cls, qreg, int(dims), *kwargs.values())
+        _gate = self._gate_cache.get(_key)
+        if _gate is None:
+            _gate = gate_cls(qreg=qreg, dims=dims, backend=self.backend, **kwargs)
+            self._gate_cache[_key] = _gate
+        return _gate
+
     def __add_moment_to_opflow(
         self,
         qreg: "Union[int, tuple[int, int]]",
@@ -166,27 +210,15 @@ class QuantumCircuit:
         :param gate_obj: Object of one of QuantumGate's child classes, e.g. HGate, XGate, etc.
         :return: True if everything goes well, else False
         """
-        _moment_data = []
-        gate_obj_added = False
         if isiterable(qreg):
+            # A multi-qudit gate occupies a single slot spanning every register between its outermost qudits
             lb, ub = min(qreg), max(qreg)
-            operation_action_space = list(
-                range(lb, ub+1)
+            _moment_data = (
+                self._identity_gates[:lb] + [gate_obj] + self._identity_gates[ub + 1 :]
             )
         else:
-            operation_action_space = []
-        for _reg in range(self._reg_length):
-            if _reg in operation_action_space:
-                if not gate_obj_added:
-                    _moment_data.append(gate_obj)
-                    gate_obj_added = True
-            else:
-                _igate = IGate(
-                    qreg=_reg, dims=self._reg_dims[_reg], backend=self.backend
-                )
-                _moment_data.append(_igate)
-                if _reg == qreg:
-                    _moment_data[_reg] = gate_obj
+            _moment_data = self._identity_gates.copy()
+            _moment_data[qreg] = gate_obj
         _curr_moment = Moment(f"Moment{len(self.op_flow._opflow_list)}", *_moment_data)
         _result = self.op_flow.populate_opflow(_curr_moment)
         return _result
@@ -200,9 +232,7 @@ class QuantumCircuit:
         :return: True if everything goes well, else False
         """
         self.__validate_gate_inputs(qreg, dims)
-        _hgate = HGate(
-            qreg=qreg, dims=dims or self._reg_dims[qreg], backend=self.backend
-        )
+        _hgate = self.__get_gate(HGate, qreg, dims or self._reg_dims[qreg])
         _result = self.__add_moment_to_opflow(qreg, _hgate)
         return _result
 
@@ -215,12 +245,7 @@ class QuantumCircuit:
         :return: True if everything goes well, else False
         """
         self.__validate_gate_inputs(qreg, dims)
-        _xgate = XGate(
-            qreg=qreg,
-            dims=dims or self._reg_dims[qreg],
-            plus=plus,
-            backend=self.backend,
-        )
+        _xgate = self.__get_gate(XGate, qreg, dims or self._reg_dims[qreg], plus=plus)
         _result = self.__add_moment_to_opflow(qreg, _xgate)
         return _result
 
@@ -233,12 +258,50 @@ class QuantumCircuit:
         :return: True if everything goes well, else False
         """
         self.__validate_gate_inputs(qreg, dims)
-        _zgate = ZGate(
-            qreg=qreg, dims=dims or self._reg_dims[qreg], backend=self.backend
-        )
+        _zgate = self.__get_gate(ZGate, qreg, dims or self._reg_dims[qreg])
         _result = self.__add_moment_to_opflow(qreg, _zgate)
         return _result
 
+    def h_all(self) -> bool:
+        """
+        Responsible for creating an HGate on every register and adding them to OperatorFlow as a single Moment.
+
+        :return: True if everything goes well, else False
+        """
+        _hgates = [
+            self.__get_gate(HGate, _reg, self._reg_dims[_reg])
+            for _reg in range(self._reg_length)
+        ]
+        _m = Moment(f"Moment{len(self.op_flow._opflow_list)}", *_hgates)
+        return self.op_flow.populate_opflow(_m)
+
+    def x_all(self, plus: Optional[int] = 1) -> bool:
+        """
+        Responsible for creating an XGate on every register and adding them to OperatorFlow as a single Moment.
+
+        :param plus: The value by which every register is incremented
+        :return: True if everything goes well, else False
+        """
+        _xgates = [
+            self.__get_gate(XGate, _reg, self._reg_dims[_reg], plus=plus)
+            for _reg in range(self._reg_length)
+        ]
+        _m = Moment(f"Moment{len(self.op_flow._opflow_list)}", *_xgates)
+        return self.op_flow.populate_opflow(_m)
+
+    def z_all(self) -> bool:
+        """
+        Responsible for creating a ZGate on every register and adding them to OperatorFlow as a single Moment.
+
+        :return: True if everything goes well, else False
+        """
+        _zgates = [
+            self.__get_gate(ZGate, _reg, self._reg_dims[_reg])
+            for _reg in range(self._reg_length)
+        ]
+        _m = Moment(f"Moment{len(self.op_flow._opflow_list)}", *_zgates)
+        return self.op_flow.populate_opflow(_m)
+
     def toffoli(self, qreg: "tuple[list[int], int]", plus: int = 1) -> bool:
         # Cx decomposition based
         # controls, target = qreg
@@ -291,13 +354,10 @@ class QuantumCircuit:
         :return: True if everything goes well, else False
         """
 
-        # active_qregs = [
-        #     self._reg_dims[qreg] for qreg in [range(acting_on[0], acting_on[1] + 1) if acting_on[0] < acting_on[1] else range(acting_on[1], acting_on[0] + 1)]
-        # ]
-        if acting_on[0] < acting_on[1]:
-            active_qregs = self._reg_dims[acting_on[0] : acting_on[1] + 1]
-        else:
-            active_qregs = self._reg_dims[acting_on[1] : acting_on[0] + 1]
+        self.__validate_gate_inputs(list(acting_on), dims)
+
+        lb, ub = min(acting_on), max(acting_on)
+        active_qregs = self._reg_dims[lb : ub + 1].tolist()
 
         _cxgate = CXGate(
             qreg=active_qregs, acting_on=acting_on, plus=plus, backend=self.backend
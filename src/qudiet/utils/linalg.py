@@ -23,7 +23,10 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from functools import lru_cache, wraps
+
 import numpy as np
+from scipy.sparse import csr_matrix
 
 
 def clip(qreg: list, start: int, end: int):
@@ -34,6 +37,50 @@ def isiterable(a):
     return hasattr(a, "__iter__")
 
 
+def read_only_cache(func):
+    """
+    Memoizes a matrix builder whose result is shared by every caller. numpy arrays are locked read-only before being
+    cached, so no caller can change the matrix seen by the others. Sparse matrices and other array types (e.g. cupy)
+    cannot be fully locked, since an assignment may reallocate their index arrays, so a copy is returned on every call
+    instead.
+    """
+
+    @lru_cache(maxsize=None)
+    def _cached(*args):
+        _matrix = func(*args)
+        if isinstance(_matrix, np.ndarray):
+            _matrix.setflags(write=False)
+            return _matrix, True
+        return _matrix, False
+
+    @wraps(func)
+    def wrapper(*args):
+        _matrix, _locked = _cached(*args)
+        return _matrix if _locked else _matrix.copy()
+
+    wrapper.cache_info = _cached.cache_info
+    wrapper.cache_clear = _cached.cache_clear
+    return wrapper
+
+
+def shift_csr(dims: int, k: int) -> csr_matrix:
+    """
+    Shift-by-k permutation of a dims level qudit, |j> -> |(j + k) mod dims>, built directly as a CSR matrix. Row i
+    holds a single 1 at column (i - k) mod dims.
+
+    shift_csr(3, 1).toarray()
+
+    [[0. 0. 1.]
+     [1. 0. 0.]
+     [0. 1. 0.]]
+    """
+    _rows = np.arange(dims)
+    return csr_matrix(
+        (np.ones(dims), (_rows - k) % dims, np.arange(dims + 1)),
+        shape=(dims, dims),
+    )
+
+
 def ttg(qreg):
     """
      qreg = [2, 3, 4]
@@ -24,15 +24,25 @@
 #
 
 import numpy as np
+import pytest
 
 from qudiet.core.backend.NumpyBackend import NumpyBackend
 from qudiet.core.backend.SparseBackend import SparseBackend
+from qudiet.core.moment import Moment, MomentSoA
 from qudiet.core.quantum_circuit import QuantumCircuit
 from qudiet.circuit_library import ArbitaryGate
+from qudiet.circuit_library.standard_gates.h import HGate
 from qudiet.circuit_library.standard_gates.i import IGate
+from qudiet.circuit_library.standard_gates.z import ZGate
 from qudiet.utils.numpy import Nbase_to_bin
 
 
+def _assert_same_states(result_1, result_2):
+    assert [state.keys() for state in result_1] == [state.keys() for state in result_2]
+    for state_1, state_2 in zip(result_1, result_2):
+        assert np.allclose(list(state_1.values()), list(state_2.values()))
+
+
 def test_qudit_init():
     qc = QuantumCircuit(
         qregs=[2, 2, 3, 3, 3, 2, 2, 2, 2, 2, 2, 2, 2],
@@ -150,3 +160,193 @@ def test_arbitary_gate():
     result = qc.run()
 
     assert result == [{'|12201>': 1.0}]
+
+
+def test_hadamard_unitary():
+    for dims in [2, 3, 4, 5]:
+        unitary = HGate(qreg=0, dims=dims, backend=NumpyBackend).unitary
+        assert np.allclose(unitary @ unitary.conj().T, np.eye(dims))
+        assert np.allclose(unitary[1], np.exp(2j * np.pi * np.arange(dims) / dims) / np.sqrt(dims))
+
+
+def test_hadamard_mixed_backends():
+    results = []
+    for backend in [NumpyBackend, SparseBackend]:
+        qc = QuantumCircuit(qregs=[2, 3], init_states=[0, 0], backend=backend)
+        qc.h(0)
+        qc.z(0)
+        qc.cx([0, 1], 1)
+        qc.h(1)
+        qc.measure_all()
+        results.append(qc.run())
+
+    assert len(results[0]) == 6
+    _assert_same_states(*results)
+
+
+def test_gate_layers():
+    qc_1 = QuantumCircuit(qregs=[2, 3, 3], backend=NumpyBackend)
+    qc_1.x(1)
+    qc_1.h_all()
+    qc_1.z_all()
+    qc_1.x_all(plus=2)
+    qc_1.measure_all()
+
+    qc_2 = QuantumCircuit(qregs=[2, 3, 3], backend=NumpyBackend)
+    qc_2.x(1)
+    for qreg in range(3):
+        qc_2.h(qreg)
+    for qreg in range(3):
+        qc_2.z(qreg)
+    for qreg in range(3):
+        qc_2.x(qreg, plus=2)
+    qc_2.measure_all()
+
+    assert qc_1.get_circuit_config()["depth"] == 4
+    _assert_same_states(qc_1.run(), qc_2.run())
+
+
+def test_moment_identity_runs():
+    dims = [2, 3, 2, 3]
+    gates = [IGate(qreg=qreg, dims=dim, backend=NumpyBackend) for qreg, dim in enumerate(dims)]
+    gates[1] = HGate(qreg=1, dims=3, backend=NumpyBackend)
+    moment = Moment("Moment1", *gates)
+
+    expected = np.kron(np.kron(np.kron(np.eye(2), gates[1].unitary), np.eye(2)), np.eye(3))
+    assert list(moment.acting_mask) == [False, True, False, False]
+    assert np.allclose(moment.exec(NumpyBackend), expected)
+
+
+def test_init_states_not_aliased():
+    init_states = [1, 2]
+    qc = QuantumCircuit(qregs=[2, 3, 3], init_states=init_states)
+
+    assert init_states == [1, 2]
+    assert qc.init_states == [1, 2, 0]
+
+
+def test_moment_soa():
+    results = []
+    for use_soa in [True, False]:
+        qc = QuantumCircuit(qregs=[2, 3, 4], init_states=[1, 0, 2], backend=NumpyBackend)
+        qc.op_flow.use_soa = use_soa
+        qc.h_all()
+        qc.x(1, plus=2)
+        qc.z(2)
+        qc.cx([0, 2], 1)
+        qc.measure_all()
+        results.append(qc.run())
+
+    moment = qc.op_flow.peek()[1]
+    moment_soa = moment.soa
+    assert list(moment_soa.tags) == [MomentSoA.H] * 3
+    assert np.allclose(moment_soa.exec(NumpyBackend), moment.exec(NumpyBackend))
+    assert qc.op_flow.peek()[0].soa is None
+
+    # Gates folded into an earlier Moment are recorded in its SoA form as well
+    qc = QuantumCircuit(qregs=[2, 3, 4], backend=NumpyBackend)
+    qc.h(0)
+    qc.x(1, plus=2)
+    moment = qc.op_flow.peek()[1]
+    assert list(moment.soa.tags) == [MomentSoA.H, MomentSoA.X, MomentSoA.I]
+    assert list(moment.soa.params) == [0, 2, 0]
+    assert np.allclose(moment.soa.exec(NumpyBackend), moment.exec(NumpyBackend))
+    qc.cx([0, 2], 1)
+    assert qc.op_flow.peek()[2].soa is None
+
+    _assert_same_states(*results)
+
+
+def test_duplicate_idempotent_moments():
+    qc = QuantumCircuit(qregs=[2, 3])
+    qc.h(0)
+    qc.gate(IGate, 1)
+    qc.gate(IGate, 1)
+    qc.gate(IGate, 0)
+    qc.measure_all()
+
+    moments = qc.op_flow.peek()
+    assert len(moments) == 4
+    assert moments[2].is_idempotent
+    assert qc.get_circuit_config()["depth"] == 2
+
+    moment_1 = Moment(
+        "Moment", IGate(qreg=0, dims=2, backend=NumpyBackend), IGate(qreg=1, dims=3, backend=NumpyBackend)
+    )
+    moment_2 = Moment(
+        "Moment", IGate(qreg=0, dims=2, backend=NumpyBackend), IGate(qreg=1, dims=3, backend=NumpyBackend)
+    )
+    assert moment_1 is not moment_2
+    assert moment_1.fingerprint == moment_2.fingerprint
+
+    qc = QuantumCircuit(qregs=[2, 3])
+    qc.h(0)
+    qc.h(0)
+    qc.measure_all()
+
+    moments = qc.op_flow.peek()
+    assert len(moments) == 4
+    assert not moments[1].is_idempotent
+    assert moments[1].fingerprint == moments[2].fingerprint
+
+
+def test_cached_unitaries_are_not_shared_mutably():
+    for backend in [NumpyBackend, SparseBackend]:
+        for gate in [HGate(qreg=0, dims=3, backend=backend), IGate(qreg=0, dims=3, backend=backend)]:
+            try:
+                gate.unitary[0, 0] = 99
+            except (ValueError, TypeError):
+                pass
+
+        for gate in [HGate(qreg=1, dims=3, backend=backend), IGate(qreg=1, dims=3, backend=backend)]:
+            unitary = gate.unitary
+            unitary = unitary.toarray() if hasattr(unitary, "toarray") else unitary
+            assert unitary[0, 0] != 99
+
+
+def test_z_unitary():
+    for dims in [2, 3, 4, 5]:
+        expected = np.diag(np.exp(2j * np.pi * np.arange(dims) / dims))
+        assert np.allclose(ZGate(qreg=0, dims=dims, backend=NumpyBackend).unitary, expected)
+        assert np.allclose(ZGate(qreg=0, dims=dims, backend=SparseBackend).unitary.toarray(), expected)
+
+
+def test_gate_cache():
+    qc = QuantumCircuit(qregs=[3, 3])
+    qc.h(0)
+    qc.h(0)
+    qc.x(0, plus=1)
+    qc.x(0, plus=2)
+
+    gates = [moment.peek_list()[0] for moment in qc.op_flow.peek()[1:]]
+    assert gates[0] is gates[1]
+    assert gates[2] is not gates[3]
+    assert (gates[2].plus, gates[3].plus) == (1, 2)
+
+
+def test_cx_out_of_bounds():
+    qc = QuantumCircuit(qregs=[2, 3, 3])
+    for acting_on in [[0, 3], [0, -1], [-2, 1]]:
+        with pytest.raises(ValueError):
+            qc.cx(acting_on, 1)
+
+
+def test_init_state_cache():
+    for backend in [NumpyBackend, SparseBackend]:
+        qc_1 = QuantumCircuit(qregs=[2, 3, 4], backend=backend)
+        qc_2 = QuantumCircuit(qregs=[2, 3, 4], backend=backend)
+        init_1, init_2 = [qc.op_flow.peek()[0].peek_list() for qc in [qc_1, qc_2]]
+        assert not any(state_1 is state_2 for state_1, state_2 in zip(init_1, init_2))
+
+        try:
+            init_1[0].init_state[0, 0] = 99
+        except (ValueError, TypeError):
+            pass
+        vector = init_2[0].init_state
+        vector = vector.toarray() if hasattr(vector, "toarray") else vector
+        assert np.allclose(vector, [[1], [0]])
+
+    qc_3 = QuantumCircuit(qregs=[2, 3, 4], init_states=[0, 1, 0], backend=NumpyBackend)
+    init_3 = qc_3.op_flow.peek()[0].peek_list()
+    assert [state.state for state in init_3] == [0, 1, 0]
+    assert np.allclose(init_3[1].init_state, [[0], [1], [0]])